@@ -15,21 +15,61 @@ Outputs:
 """
 
 import json, os, re, sys, uuid, argparse
+import atexit
+import mimetypes
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+import numpy as np
 try:
-    from flask import Flask, request, redirect, url_for, send_from_directory, jsonify, render_template_string, abort
+    from flask import Flask, Response, g, request, redirect, url_for, send_from_directory, jsonify, abort
 except Exception:
     # Flask is optional for CLI usage; import lazily in serve mode
     Flask = None  # type: ignore
+    Response = None  # type: ignore
+    g = None  # type: ignore
     request = None  # type: ignore
     redirect = None  # type: ignore
     url_for = None  # type: ignore
     send_from_directory = None  # type: ignore
     jsonify = None  # type: ignore
-    render_template_string = None  # type: ignore
     abort = None  # type: ignore
+try:
+    import orjson  # optional: much faster JSON encode/decode when installed
+except Exception:
+    orjson = None  # type: ignore
+try:
+    import pyvips  # optional: much faster PNG encoding when installed
+except Exception:
+    pyvips = None  # type: ignore
+try:
+    import liburing  # optional: batched statx via io_uring on Linux
+except Exception:
+    liburing = None  # type: ignore
+try:
+    import zstandard  # optional: zstd-compressed API responses
+except Exception:
+    zstandard = None  # type: ignore
+try:
+    import uno  # optional: persistent LibreOffice bridge for slide export
+    from com.sun.star.beans import PropertyValue as _UnoPropertyValue
+except Exception:
+    uno = None  # type: ignore
+    _UnoPropertyValue = None  # type: ignore
+from lxml import etree
 from pptx import Presentation
-from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.shapes import MSO_AUTO_SHAPE_TYPE, MSO_SHAPE_TYPE
+from pptx.shapes.autoshape import Shape
+from pptx.shapes.connector import Connector
+from pptx.shapes.graphfrm import GraphicFrame
+from pptx.shapes.group import GroupShape
+from pptx.shapes.picture import Picture
+
+# Prime the mimetype table once so the first static send doesn't pay for it.
+mimetypes.init()
 
 NS = {
     "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
@@ -38,6 +78,27 @@ NS = {
     "dgm": "http://schemas.openxmlformats.org/drawingml/2006/diagram",
 }
 
+# graphicData uri for embedded tables (no prefix in NS; only compared against)
+_URI_TABLE = "http://schemas.openxmlformats.org/drawingml/2006/table"
+
+# Fully-qualified tag names for direct lxml iteration (graphicFrame children
+# have a fixed shallow structure, so a C-level iter() beats a descendant XPath).
+_Q_GRAPHIC = "{%s}graphic" % NS["a"]
+_Q_GRAPHICDATA = "{%s}graphicData" % NS["a"]
+_Q_OFF = "{%s}off" % NS["a"]
+_Q_EXT = "{%s}ext" % NS["a"]
+_Q_CNVPR = "{%s}cNvPr" % NS["p"]
+
+# Precompiled XPath expressions (compiling the string per call is the slow path
+# in lxml; these run once per module import and are reused on every shape).
+_XP_A_T = etree.XPath(".//a:t", namespaces=NS)
+# One boolean query: a line not overridden by a:noFill, or a shape-props
+# element carrying an explicit solid/gradient/pattern fill.
+_XP_HAS_VISIBLE = etree.XPath(
+    "boolean(.//a:ln[not(a:noFill)]"
+    " | .//a:spPr[not(a:noFill)][a:solidFill or a:gradFill or a:pattFill])",
+    namespaces=NS)
+
 # ---------- small helpers ----------
 def tag_name(shape):
     try:
@@ -47,20 +108,17 @@ def tag_name(shape):
         return ""
 
 def rel_bbox(left, top, width, height, total_w, total_h):
-    def r(v, denom): return round(float(v)/float(denom), 6) if denom else 0.0
-    return [r(left, total_w), r(top, total_h), r(width, total_w), r(height, total_h)]
-
-def _safe_has_text_frame(shape):
-    try:
-        return bool(getattr(shape, "has_text_frame", False) and shape.text_frame)
-    except Exception:
-        return False
+    # tuple, not list: immutable, smaller, and faster to JSON-serialize
+    iw = 1.0 / total_w if total_w else 0.0
+    ih = 1.0 / total_h if total_h else 0.0
+    return (round(left * iw, 6), round(top * ih, 6),
+            round(width * iw, 6), round(height * ih, 6))
 
 def _extract_text(shape, max_chars=2000):
-    if not _safe_has_text_frame(shape):
-        return ""
+    # Read a:t descendants directly; building python-pptx paragraph/run
+    # wrappers just to concatenate their text is far more expensive.
     try:
-        return "".join([p.text or "" for p in shape.text_frame.paragraphs])[:max_chars]
+        return "".join(t.text or "" for t in _XP_A_T(shape._element))[:max_chars]
     except Exception:
         return ""
 
@@ -70,17 +128,22 @@ def has_text(shape):
     except Exception:
         return False
 
+def _graphic_data_uri(shape):
+    """Return the a:graphicData uri of a graphicFrame shape, or None."""
+    try:
+        for el in shape._element.iter(_Q_GRAPHICDATA):
+            return el.get("uri")
+        return None
+    except Exception:
+        return None
+
 def is_chart(shape):
     try:
         _ = shape.chart
         return True
     except Exception:
         pass
-    try:
-        gd = shape._element.xpath(".//a:graphicData", namespaces=NS)
-        return any(el.get("uri") == NS["c"] for el in gd)
-    except Exception:
-        return False
+    return _graphic_data_uri(shape) == NS["c"]
 
 def is_table(shape):
     try:
@@ -90,27 +153,12 @@ def is_table(shape):
         return False
 
 def is_smart_art(shape):
-    try:
-        gd = shape._element.xpath(".//a:graphicData", namespaces=NS)
-        return any(el.get("uri") == NS["dgm"] for el in gd)
-    except Exception:
-        return False
+    return _graphic_data_uri(shape) == NS["dgm"]
 
 def _has_visible_fill_or_line(shape):
     """Return True if the shape has a visible line or fill (not a:noFill)."""
     try:
-        el = shape._element
-        # line
-        for l in el.xpath(".//a:ln", namespaces=NS):
-            if l.find("./a:noFill", namespaces=NS) is None:
-                return True
-        # fill on spPr
-        spPr = el.find(".//a:spPr", namespaces=NS)
-        if spPr is not None and spPr.find("./a:noFill", namespaces=NS) is None:
-            if any(spPr.find(tag, namespaces=NS) is not None
-                   for tag in ("./a:solidFill", "./a:gradFill", "./a:pattFill")):
-                return True
-        return False
+        return bool(_XP_HAS_VISIBLE(shape._element))
     except Exception:
         return False
 
@@ -119,25 +167,22 @@ def _extract_text_style(shape):
     Chooses the maximum font size seen; bold is True if any run is bold.
     """
     try:
-        if not _safe_has_text_frame(shape):
+        if not getattr(shape, "has_text_frame", False):
             return {"font_pt": None, "bold": None}
         max_pt = None
         any_bold = None
         for p in shape.text_frame.paragraphs:
-            for r in getattr(p, 'runs', []) or []:
-                fnt = getattr(r, 'font', None)
-                if fnt is None:
-                    continue
-                sz = getattr(fnt, 'size', None)
+            for r in p.runs:
+                fnt = r.font
+                sz = fnt.size
                 if sz is not None:
                     try:
-                        pt = float(getattr(sz, 'pt', None) or 0.0)
-                        if pt > 0.0:
-                            if (max_pt is None) or (pt > max_pt):
-                                max_pt = pt
+                        pt = float(sz.pt or 0.0)
                     except Exception:
-                        pass
-                b = getattr(fnt, 'bold', None)
+                        pt = 0.0
+                    if pt > 0.0:
+                        max_pt = pt if max_pt is None else max(max_pt, pt)
+                b = fnt.bold
                 if b is not None:
                     any_bold = bool(b) if any_bold is None else (any_bold or bool(b))
         return {"font_pt": max_pt, "bold": any_bold}
@@ -146,6 +191,23 @@ def _extract_text_style(shape):
 
 # ---------- classification ----------
 _BADGE_ICON_RE = re.compile(r"^(?:[0-9]{1,2}|!)$")
+
+# Connector-like auto shape types (structural, not heuristic); built once
+# instead of re-resolving a dozen enum attributes per sp shape. Looked up
+# on MSO_AUTO_SHAPE_TYPE since that is what shape.auto_shape_type returns
+# (its members compare equal to other enums by int value, so mixing enums
+# here would mislabel unrelated shapes); names the installed python-pptx
+# doesn't expose are skipped.
+_CONNECTOR_MSO_TYPES = frozenset(
+    t for t in (getattr(MSO_AUTO_SHAPE_TYPE, name, None) for name in (
+        "LINE", "STRAIGHT_CONNECTOR_1",
+        "BENT_CONNECTOR_2", "BENT_CONNECTOR_3",
+        "BENT_CONNECTOR_4", "BENT_CONNECTOR_5",
+        "CURVED_CONNECTOR_2", "CURVED_CONNECTOR_3",
+        "CURVED_CONNECTOR_4", "CURVED_CONNECTOR_5",
+        "CURVE",
+    )) if t is not None
+)
 def _rel_area(shape, slide_hints):
     try:
         return (float(shape.width) * float(shape.height)) / (float(slide_hints["w"]) * float(slide_hints["h"]))
@@ -153,9 +215,9 @@ def _rel_area(shape, slide_hints):
         return 0.0
 
 
-def classify(shape, slide_hints):
-    t = tag_name(shape)
-
+def classify(shape, tag, text, slide_hints):
+    """Classify a shape; `tag` and `text` are precomputed by the walkers so
+    the XML is traversed once per shape rather than once per predicate."""
     # placeholders -> text
     try:
         if getattr(shape, "is_placeholder", False):
@@ -163,36 +225,34 @@ def classify(shape, slide_hints):
     except Exception:
         pass
 
-    if t == "grpSp":
+    if tag == "grpSp":
         return "group"
-    if t == "cxnSp":
+    if tag == "cxnSp":
         return "connector"
-    if t == "pic":
+    if tag == "pic":
         return "image"
 
-    if t == "graphicFrame":
-        if is_chart(shape):     return "chart"
-        if is_table(shape):     return "table"
-        if is_smart_art(shape): return "figure"
+    if tag == "graphicFrame":
+        uri = _graphic_data_uri(shape)
+        if uri == NS["c"]:    return "chart"
+        if uri == _URI_TABLE: return "table"
+        if uri == NS["dgm"]:  return "figure"
         return "shape"
 
-    if t == "sp":
-        # Connector-like auto shapes (structural, not heuristic)
-        try:
-            connector_types = {
-                MSO_SHAPE_TYPE.LINE, MSO_SHAPE_TYPE.STRAIGHT_CONNECTOR_1,
-                MSO_SHAPE_TYPE.BENT_CONNECTOR_2, MSO_SHAPE_TYPE.BENT_CONNECTOR_3,
-                MSO_SHAPE_TYPE.BENT_CONNECTOR_4, MSO_SHAPE_TYPE.BENT_CONNECTOR_5,
-                MSO_SHAPE_TYPE.CURVED_CONNECTOR_2, MSO_SHAPE_TYPE.CURVED_CONNECTOR_3,
-                MSO_SHAPE_TYPE.CURVED_CONNECTOR_4, MSO_SHAPE_TYPE.CURVED_CONNECTOR_5,
-                MSO_SHAPE_TYPE.CURVE
-            }
-            if shape.auto_shape_type in connector_types:
-                return "connector"
-        except (AttributeError, KeyError):
-            pass
+    if tag == "sp":
+        if _CONNECTOR_MSO_TYPES:
+            try:
+                # ValueError: textboxes and other non-auto sp shapes
+                if shape.auto_shape_type in _CONNECTOR_MSO_TYPES:
+                    return "connector"
+            except (AttributeError, KeyError, ValueError):
+                pass
 
-        if has_text(shape):
+        stripped = text.strip()
+        if stripped:
+            # badge text (single digit or "!") over a visible background -> icon
+            if _BADGE_ICON_RE.match(stripped) and _has_visible_fill_or_line(shape):
+                return "icon"
             return "text"
         if _has_visible_fill_or_line(shape):
             return "shape"
@@ -202,47 +262,139 @@ def classify(shape, slide_hints):
 
 
 # ---------- JSON model ----------
-def base_component(shape, slide_idx, ctype, slide_hints, z=0, group_id=None, forced_id=None):
-    left, top, width, height = int(shape.left), int(shape.top), int(shape.width), int(shape.height)
-    rel = rel_bbox(left, top, width, height, slide_hints["w"], slide_hints["h"])
-    cid = forced_id if forced_id else f"s{slide_idx}_c{shape.shape_id}"
-    comp = {
-        "id": cid,
-        "type": ctype,
-        "bbox_emus": [left, top, width, height],
-        "bbox_rel": rel,
-        "z": z,
-        "group_id": group_id,
-        "debug": {"tag": tag_name(shape)}
-    }
-    if ctype in ("text",):
-        style = _extract_text_style(shape)
-        comp["text_style"] = style
-    return comp
+@dataclass(slots=True)
+class Comp:
+    """In-memory component record; far smaller than a per-shape dict.
+
+    Only materialized into the JSON dict shape once per slide, after the
+    icon-suppression pass has run over the compact records.
+    """
+    id: str
+    type: str
+    bbox_emus: tuple
+    bbox_rel: tuple
+    z: int
+    group_id: Optional[str]
+    tag: str
+    text_style: Optional[dict] = None
+
+    def to_dict(self):
+        d = {
+            "id": self.id,
+            "type": self.type,
+            "bbox_emus": self.bbox_emus,
+            "bbox_rel": self.bbox_rel,
+            "z": self.z,
+            "group_id": self.group_id,
+            "debug": {"tag": self.tag}
+        }
+        if self.text_style is not None:
+            d["text_style"] = self.text_style
+        return d
+
+
+def _shape_dims(shape):
+    """Read (left, top, width, height) EMUs straight off the lxml element.
+
+    Avoids python-pptx's property descriptors (which re-walk the XML per
+    access); falls back to them for shapes without an explicit a:xfrm,
+    e.g. placeholders inheriting position from the layout.
+    """
+    try:
+        el = shape._element
+        off = next(el.iter(_Q_OFF), None)
+        ext = next(el.iter(_Q_EXT), None)
+        if off is not None and ext is not None:
+            return (int(off.get("x")), int(off.get("y")),
+                    int(ext.get("cx")), int(ext.get("cy")))
+    except Exception:
+        pass
+    return int(shape.left), int(shape.top), int(shape.width), int(shape.height)
+
+
+def _shape_id(shape):
+    """Read the shape id from p:cNvPr, falling back to shape.shape_id."""
+    try:
+        for el in shape._element.iter(_Q_CNVPR):
+            sid = el.get("id")
+            if sid is not None:
+                return int(sid)
+            break
+    except Exception:
+        pass
+    return shape.shape_id
+
+
+def base_component(shape, slide_idx, ctype, slide_hints, z=0, group_id=None, forced_id=None, tag=None, dims=None, sid=None):
+    if dims is None:
+        dims = _shape_dims(shape)
+    left, top, width, height = dims
+    # reciprocals precomputed once per slide in _slide_hints
+    iw, ih = slide_hints["inv_w"], slide_hints["inv_h"]
+    rel = (round(left * iw, 6), round(top * ih, 6),
+           round(width * iw, 6), round(height * ih, 6))
+    cid = forced_id if forced_id else f"s{slide_idx}_c{sid if sid is not None else _shape_id(shape)}"
+    style = _extract_text_style(shape) if ctype in ("text", "icon") else None
+    return Comp(
+        id=cid,
+        type=ctype,
+        bbox_emus=(left, top, width, height),
+        bbox_rel=rel,
+        z=z,
+        group_id=group_id,
+        tag=tag if tag is not None else tag_name(shape),
+        text_style=style,
+    )
+
+# Direct tag -> wrapper dispatch for group children; iterating
+# group_shape.shapes routes every child through python-pptx's
+# _ShapeFactory, which is needless overhead when the tag already
+# determines the class we want.
+_SHAPE_CLS_BY_TAG = {
+    "sp": Shape,
+    "grpSp": GroupShape,
+    "pic": Picture,
+    "cxnSp": Connector,
+    "graphicFrame": GraphicFrame,
+}
+
 
 def walk_group_children(group_shape, slide_idx, items, slide_hints, parent_id, z_start=0):
     z = z_start
-    for shp in group_shape.shapes:
-        ctype = classify(shp, slide_hints)
+    for el in group_shape._element:
+        t = el.tag
+        tag = t.rsplit('}', 1)[-1] if '}' in t else t
+        cls = _SHAPE_CLS_BY_TAG.get(tag)
+        if cls is None:
+            continue  # nvGrpSpPr, grpSpPr, ...
+        shp = cls(el, group_shape)
+        text = _extract_text(shp) if tag == "sp" else ""
+        dims = _shape_dims(shp)
+        sid = _shape_id(shp)
+        ctype = classify(shp, tag, text, slide_hints)
         if ctype == "group":
-            gid = f"s{slide_idx}_g{shp.shape_id}"
-            items.append(base_component(shp, slide_idx, "figure", slide_hints, z=z, group_id=parent_id, forced_id=gid))
+            gid = f"s{slide_idx}_g{sid}"
+            items.append(base_component(shp, slide_idx, "figure", slide_hints, z=z, group_id=parent_id, forced_id=gid, tag=tag, dims=dims, sid=sid))
             z = walk_group_children(shp, slide_idx, items, slide_hints, gid, z_start=z+1)
         else:
-            items.append(base_component(shp, slide_idx, ctype, slide_hints, z=z, group_id=parent_id))
+            items.append(base_component(shp, slide_idx, ctype, slide_hints, z=z, group_id=parent_id, tag=tag, dims=dims, sid=sid))
             z += 1
     return z
 
 def walk_shapes(slide, slide_idx, items, slide_hints):
     z = 0
     for shp in slide.shapes:
-        ctype = classify(shp, slide_hints)
+        tag = tag_name(shp)
+        text = _extract_text(shp) if tag == "sp" else ""
+        dims = _shape_dims(shp)
+        sid = _shape_id(shp)
+        ctype = classify(shp, tag, text, slide_hints)
         if ctype == "group":
-            gid = f"s{slide_idx}_g{shp.shape_id}"
-            items.append(base_component(shp, slide_idx, "figure", slide_hints, z=z, forced_id=gid))
+            gid = f"s{slide_idx}_g{sid}"
+            items.append(base_component(shp, slide_idx, "figure", slide_hints, z=z, forced_id=gid, tag=tag, dims=dims, sid=sid))
             z = walk_group_children(shp, slide_idx, items, slide_hints, gid, z_start=z+1)
         else:
-            items.append(base_component(shp, slide_idx, ctype, slide_hints, z=z))
+            items.append(base_component(shp, slide_idx, ctype, slide_hints, z=z, tag=tag, dims=dims, sid=sid))
             z += 1
     return items
 
@@ -265,37 +417,106 @@ def _suppress_icon_backgrounds(items):
     # index shapes by group
     by_group = {}
     for i, c in enumerate(items):
-        by_group.setdefault(c.get("group_id"), []).append(i)
+        by_group.setdefault(c.group_id, []).append(i)
 
     for grp, idxs in by_group.items():
-        icons = [i for i in idxs if items[i]["type"] == "icon"]
-        shapes = [i for i in idxs if items[i]["type"] == "shape"]
+        icons = [i for i in idxs if items[i].type == "icon"]
+        shapes = [i for i in idxs if items[i].type == "shape"]
         if not icons or not shapes:
             continue
-        for ii in icons:
-            ibox = items[ii]["bbox_rel"]
-            iarea = ibox[2] * ibox[3]
-            for sj in shapes:
-                sbox = items[sj]["bbox_rel"]
-                sarea = sbox[2] * sbox[3]
-                # Heuristic: strong overlap and comparable size (bg slightly smaller or larger)
-                if _iou(ibox, sbox) >= 0.55 and 0.4 <= (sarea / iarea) <= 1.6:
-                    items[sj]["type"] = "icon_bg"    # mark as background
-
-
-def process_pptx(path):
+        # Pairwise IoU via broadcasting instead of a Python icon x shape loop
+        ibox = np.asarray([items[i].bbox_rel for i in icons], dtype=np.float32)
+        sbox = np.asarray([items[j].bbox_rel for j in shapes], dtype=np.float32)
+        ix1 = np.maximum(ibox[:, None, 0], sbox[None, :, 0])
+        iy1 = np.maximum(ibox[:, None, 1], sbox[None, :, 1])
+        ix2 = np.minimum(ibox[:, None, 0] + ibox[:, None, 2], sbox[None, :, 0] + sbox[None, :, 2])
+        iy2 = np.minimum(ibox[:, None, 1] + ibox[:, None, 3], sbox[None, :, 1] + sbox[None, :, 3])
+        inter = np.clip(ix2 - ix1, 0.0, None) * np.clip(iy2 - iy1, 0.0, None)
+        iarea = ibox[:, 2] * ibox[:, 3]
+        sarea = sbox[:, 2] * sbox[:, 3]
+        union = iarea[:, None] + sarea[None, :] - inter
+        iou = inter / np.where(union > 0.0, union, 1e-9)
+        ratio = sarea[None, :] / np.where(iarea[:, None] > 0.0, iarea[:, None], 1e-9)
+        # Heuristic: strong overlap and comparable size (bg slightly smaller or larger)
+        hit = (iou >= 0.55) & (ratio >= 0.4) & (ratio <= 1.6)
+        for sj in np.flatnonzero(hit.any(axis=0)):
+            items[shapes[sj]].type = "icon_bg"    # mark as background
+
+
+def _slide_hints(prs):
+    w, h = int(prs.slide_width), int(prs.slide_height)
+    return {"w": w, "h": h,
+            "inv_w": 1.0 / w if w else 0.0,
+            "inv_h": 1.0 / h if h else 0.0}
+
+
+def _walk_slide(slide, idx, hints):
+    items = []
+    walk_shapes(slide, idx, items, hints)
+    _suppress_icon_backgrounds(items)   # <<< NEW: hide badge backgrounds
+    return {
+        "index": idx,
+        "canvas": {"w_emus": hints["w"], "h_emus": hints["h"]},
+        "components": [c.to_dict() for c in items]
+    }
+
+
+def _walk_slide_slice(path, indices):
+    """Worker: reopen the PPTX and walk a subset of its slides.
+
+    Reparsing the file per worker is cheap relative to walking many
+    shapes, and avoids pickling lxml trees across the process boundary.
+    """
     prs = Presentation(path)
+    hints = _slide_hints(prs)
+    slides = list(prs.slides)
+    return [_walk_slide(slides[i], i, hints) for i in indices]
+
+
+# Below this many slides, process-pool startup costs more than it saves.
+_PARALLEL_SLIDE_THRESHOLD = 16
+
+
+@lru_cache(maxsize=8)
+def _get_presentation(path, mtime_ns, size):
+    """Parse a PPTX, memoized on (path, mtime, size) so repeat operations
+    on the same upload skip the full ZIP+XML reparse."""
+    return Presentation(path)
+
+
+def process_pptx(path, prs: "Presentation | None" = None):
+    """Build the spatial mapping for path.
+
+    A caller that already holds the parsed Presentation can pass it in to
+    skip the stat+cache lookup; otherwise the memoized parse is used.
+    """
+    if prs is None:
+        st = os.stat(path)
+        prs = _get_presentation(path, st.st_mtime_ns, st.st_size)
+    hints = _slide_hints(prs)
     out = {"file": path, "slides": []}
-    for idx, slide in enumerate(prs.slides):
-        hints = {"w": int(prs.slide_width), "h": int(prs.slide_height)}
-        items = []
-        walk_shapes(slide, idx, items, hints)
-        _suppress_icon_backgrounds(items)   # <<< NEW: hide badge backgrounds
-        out["slides"].append({
-            "index": idx,
-            "canvas": {"w_emus": hints["w"], "h_emus": hints["h"]},
-            "components": items
-        })
+    slides = list(prs.slides)
+    n = len(slides)
+
+    cpus = os.cpu_count() or 1
+    if n >= _PARALLEL_SLIDE_THRESHOLD and cpus > 1:
+        # Slide walks are independent pure-Python work: fan out across cores.
+        from concurrent.futures import ProcessPoolExecutor
+        workers = min(cpus, n)
+        chunks = [list(range(k, n, workers)) for k in range(workers)]
+        try:
+            results = []
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                for part in ex.map(_walk_slide_slice, [path] * workers, chunks):
+                    results.extend(part)
+            results.sort(key=lambda s: s["index"])
+            out["slides"] = results
+            return out
+        except Exception:
+            pass  # fall through to the serial walk
+
+    for idx, slide in enumerate(slides):
+        out["slides"].append(_walk_slide(slide, idx, hints))
     return out
 
 
@@ -322,43 +543,114 @@ TYPE_CODE = {
     "unknown": 8,
 }
 
+# Per-type label metadata precomputed once: (code string, label box width)
+_TYPE_META = {name: (str(code), max(6 * len(str(code)), 14)) for name, code in TYPE_CODE.items()}
+_TYPE_META_DEFAULT = ("8", 14)
+_LABEL_PAD = 3
+_LABEL_TH = 12
+_WHITE = (255, 255, 255)
+
+# Component count above which a slide is rasterized into a NumPy
+# framebuffer instead of per-component Pillow calls.
+_NP_RASTER_THRESHOLD = 256
+
+def _save_png(img, out_path):
+    """Encode a PIL image to PNG; prefers libvips, falls back to Pillow.
+
+    Uses a low compression level in both paths — previews are throwaway
+    artifacts, so encode speed matters more than a few percent of size.
+    """
+    if pyvips is not None:
+        try:
+            w, h = img.size
+            pyvips.Image.new_from_memory(img.tobytes(), w, h, 3, "uchar").pngsave(out_path, compression=1)
+            return
+        except Exception:
+            pass
+    img.save(out_path, "PNG", compress_level=1)
+
+
 def draw_previews(mapping, out_dir, img_width=1600, stroke=3, draw_labels=True, show_legend=True, show_groups=True):
     from PIL import Image, ImageDraw, ImageFont
+    from concurrent.futures import ThreadPoolExecutor
     os.makedirs(out_dir, exist_ok=True)
 
     def want(comp):
         return True
 
+    executor = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+    pending = []
+
+    try:
+        font = ImageFont.load_default()
+    except Exception:
+        font = None
+
+    # Render each numeric label once; pasting a sprite is a single memcpy
+    # versus a rectangle fill plus text call per component.
+    sprites = {}
+    if draw_labels:
+        for name, (code, tw) in [*_TYPE_META.items(), (None, _TYPE_META_DEFAULT)]:
+            sp = Image.new("RGB", (tw + 2 * _LABEL_PAD + 1, _LABEL_TH + 2 * _LABEL_PAD + 1), _WHITE)
+            ImageDraw.Draw(sp).text((_LABEL_PAD, _LABEL_PAD), code, fill=(0, 0, 0), font=font)
+            sprites[name] = sp
+    sprite_arrs = {name: np.asarray(sp) for name, sp in sprites.items()}
+
     for slide in mapping["slides"]:
         W_emus, H_emus = slide["canvas"]["w_emus"], slide["canvas"]["h_emus"]
         aspect = H_emus / float(W_emus) if W_emus else 9/16.0
         W = int(img_width)
         H = max(1, int(round(W*aspect)))
 
-        img = Image.new("RGB", (W, H), (255, 255, 255))
-        draw = ImageDraw.Draw(img)
-        try:
-            font = ImageFont.load_default()
-        except Exception:
-            font = None
-
-        for comp in slide["components"]:
-            if not want(comp):
-                continue
-            t = comp.get("type", "unknown")
-            color = (0, 0, 0)
-            x, y, w, h = comp["bbox_rel"]
-            x0, y0 = int(round(x * W)), int(round(y * H))
-            x1, y1 = int(round((x + w) * W)), int(round((y + h) * H))
-            for s in range(stroke):
-                draw.rectangle([x0 - s, y0 - s, x1 + s, y1 + s], outline=color, width=1)
-            if draw_labels:
-                code = str(TYPE_CODE.get(t, 8))
-                pad = 3
-                tw = max(6 * len(code), 14)
-                th = 12
-                draw.rectangle([x0, y0, x0 + tw + 2 * pad, y0 + th + 2 * pad], fill=(255, 255, 255))
-                draw.text((x0 + pad, y0 + pad), code, fill=color, font=font)
+        comps = [c for c in slide["components"] if want(c)]
+        if comps:
+            # Scale all bboxes to pixel corners in one vectorized pass
+            xywh = np.asarray([c["bbox_rel"] for c in comps], dtype=np.float64)
+            xywh *= (W, H, W, H)
+            corners = np.empty_like(xywh)
+            corners[:, :2] = xywh[:, :2]
+            corners[:, 2:] = xywh[:, :2] + xywh[:, 2:]
+            corners = corners.round().astype(np.int32)
+        else:
+            corners = np.empty((0, 4), dtype=np.int32)
+
+        if len(comps) >= _NP_RASTER_THRESHOLD:
+            # Dense slide: draw into a NumPy framebuffer with slice stores
+            # (no per-component Pillow round trips), convert to PIL once.
+            buf = np.full((H, W, 3), 255, dtype=np.uint8)
+            for comp, (x0, y0, x1, y1) in zip(comps, corners.tolist()):
+                X0, Y0 = x0 - stroke + 1, y0 - stroke + 1
+                X1, Y1 = x1 + stroke - 1, y1 + stroke - 1
+                cx0, cx1 = max(X0, 0), min(X1 + 1, W)
+                cy0, cy1 = max(Y0, 0), min(Y1 + 1, H)
+                if cx1 <= cx0 or cy1 <= cy0:
+                    continue
+                # Band stops are clamped to >= 0 as well: a negative stop
+                # (off-canvas component) would wrap around and black out
+                # nearly the whole row/column span.
+                buf[cy0:max(min(Y0 + stroke, H), 0), cx0:cx1] = 0  # top band
+                buf[max(Y1 - stroke + 1, 0):cy1, cx0:cx1] = 0      # bottom band
+                buf[cy0:cy1, cx0:max(min(X0 + stroke, W), 0)] = 0  # left band
+                buf[cy0:cy1, max(X1 - stroke + 1, 0):cx1] = 0      # right band
+                if draw_labels:
+                    sa = sprite_arrs[comp.get("type") if comp.get("type") in sprite_arrs else None]
+                    sx, sy = max(x0, 0), max(y0, 0)
+                    ex, ey = min(x0 + sa.shape[1], W), min(y0 + sa.shape[0], H)
+                    if sx < ex and sy < ey:
+                        buf[sy:ey, sx:ex] = sa[sy - y0:ey - y0, sx - x0:ex - x0]
+            img = Image.fromarray(buf)
+            draw = ImageDraw.Draw(img)
+        else:
+            img = Image.new("RGB", (W, H), (255, 255, 255))
+            draw = ImageDraw.Draw(img)
+            for comp, (x0, y0, x1, y1) in zip(comps, corners.tolist()):
+                t = comp.get("type", "unknown")
+                color = (0, 0, 0)
+                # Single stroked rectangle instead of `stroke` 1px outlines
+                draw.rectangle([x0 - stroke + 1, y0 - stroke + 1, x1 + stroke - 1, y1 + stroke - 1],
+                               outline=color, width=stroke)
+                if draw_labels:
+                    img.paste(sprites[t if t in sprites else None], (x0, y0))
 
         if show_legend:
             pad = 8
@@ -369,30 +661,362 @@ def draw_previews(mapping, out_dir, img_width=1600, stroke=3, draw_labels=True,
                 cy += 16
 
         out_path = os.path.join(out_dir, f"slide_{slide['index']:02d}.png")
-        img.save(out_path, "PNG")
+        # PNG encoding releases the GIL; overlap it with drawing the next slide
+        pending.append(executor.submit(_save_png, img, out_path))
+
+    for fut in pending:
+        fut.result()
+    executor.shutdown()
 
 
 # ---------- job mapping helpers ----------
 
+def _read_json_file(path: str):
+    """Parse a JSON file, via orjson when available (3-10x faster)."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json_file(path: str, obj) -> None:
+    """Atomically replace path with obj serialized as indented JSON.
+
+    On Linux the payload goes to an unnamed O_TMPFILE inode that is linked
+    into place, so readers never observe a truncated file and no temp file
+    is left behind on a crash; elsewhere a named temp file + os.replace
+    gives the same atomicity.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(obj, indent=2).encode('utf-8')
+    dir_path = os.path.dirname(path) or '.'
+    if hasattr(os, 'O_TMPFILE'):
+        # Filesystems without O_TMPFILE or /proc linking (e.g. overlayfs)
+        # raise OSError here; fall through to the named-temp-file path.
+        try:
+            fd = os.open(dir_path, os.O_TMPFILE | os.O_WRONLY, 0o644)
+        except OSError:
+            fd = None
+        if fd is not None:
+            tmp_link = f"{path}.{uuid.uuid4().hex}.tmp"
+            try:
+                os.write(fd, payload)
+                os.link(f"/proc/self/fd/{fd}", tmp_link)
+                linked = True
+            except OSError:
+                linked = False
+            finally:
+                os.close(fd)
+            if linked:
+                os.replace(tmp_link, path)
+                return
+    import tempfile
+    with tempfile.NamedTemporaryFile(dir=dir_path, delete=False) as tf:
+        tf.write(payload)
+        tmp = tf.name
+    os.replace(tmp, path)
+
+
+def _scandir_files(dir_path: str, suffix: str, lower: bool = False):
+    """Names of regular files in dir_path ending with suffix.
+
+    os.scandir fuses the listing and the stat (DirEntry caches it), unlike
+    the listdir + per-name filter pattern it replaces.
+    """
+    try:
+        with os.scandir(dir_path) as it:
+            if lower:
+                return [e.name for e in it if e.name.lower().endswith(suffix) and e.is_file()]
+            return [e.name for e in it if e.name.endswith(suffix) and e.is_file()]
+    except OSError:
+        return []
+
+
+def _scandir_dirs(dir_path: str, suffix: str):
+    """Names of subdirectories of dir_path ending with suffix."""
+    try:
+        with os.scandir(dir_path) as it:
+            return [e.name for e in it
+                    if e.name.endswith(suffix) and e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+
+
+@lru_cache(maxsize=256)
+def _read_job_meta(path: str, mtime_ns: int):
+    return _read_json_file(path)
+
+
+def _load_job_meta(job_dir: str):
+    """Return the job's summary.json dict, or None for legacy jobs."""
+    path = os.path.join(job_dir, 'summary.json')
+    try:
+        st = os.stat(path)
+        return _read_job_meta(path, st.st_mtime_ns)
+    except Exception:
+        return None
+
+
+def _job_json_file(job_dir: str):
+    """Resolve a job's .spatial.json filename: meta first, scandir fallback."""
+    meta = _load_job_meta(job_dir)
+    if meta:
+        name = meta.get('json_file')
+        if name and os.path.isfile(os.path.join(job_dir, name)):
+            return name
+    names = _scandir_files(job_dir, '.spatial.json')
+    return names[0] if names else None
+
+
+def _job_previews_dir(job_dir: str):
+    """Resolve a job's previews directory: meta first, scandir fallback."""
+    meta = _load_job_meta(job_dir)
+    if meta:
+        rel = meta.get('previews_rel')
+        if rel and os.path.isdir(os.path.join(job_dir, rel)):
+            return os.path.join(job_dir, rel)
+    names = _scandir_dirs(job_dir, '_previews')
+    return os.path.join(job_dir, names[0]) if names else None
+
+
+# Parsed-mapping cache keyed on (path, mtime_ns, size): editor API calls
+# hit _load_job_mapping on every request and the file rarely changes
+# between them. Saves refresh the entry, so writers invalidate naturally.
+_MAPPING_CACHE: "OrderedDict[tuple, tuple[dict, str]]" = OrderedDict()
+_MAPPING_CACHE_MAX = 64
+_MAPPING_CACHE_LOCK = threading.Lock()
+
+
+def _mapping_cache_put(path: str, mapping: dict, json_file: str) -> None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _MAPPING_CACHE_LOCK:
+        _MAPPING_CACHE[key] = (mapping, json_file)
+        _MAPPING_CACHE.move_to_end(key)
+        while len(_MAPPING_CACHE) > _MAPPING_CACHE_MAX:
+            _MAPPING_CACHE.popitem(last=False)
+
+
 def _load_job_mapping(job_dir: str):
-    json_files = [f for f in os.listdir(job_dir) if f.endswith('.spatial.json')]
-    if not json_files:
+    json_file = _job_json_file(job_dir)
+    if not json_file:
         raise FileNotFoundError('No mapping JSON found')
-    json_file = json_files[0]
-    with open(os.path.join(job_dir, json_file), 'r', encoding='utf-8') as f:
-        mapping = json.load(f)
+    path = os.path.join(job_dir, json_file)
+    st = os.stat(path)
+    key = (path, st.st_mtime_ns, st.st_size)
+    with _MAPPING_CACHE_LOCK:
+        hit = _MAPPING_CACHE.get(key)
+        if hit is not None:
+            _MAPPING_CACHE.move_to_end(key)
+            return hit
+    mapping = _read_json_file(path)
+    _fold_edits(job_dir, mapping)
+    _mapping_cache_put(path, mapping, json_file)
     return mapping, json_file
 
 
 def _save_job_mapping(job_dir: str, mapping: dict, json_file: str) -> None:
     path = os.path.join(job_dir, json_file)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(mapping, f, indent=2)
+    _write_json_file(path, mapping)
+    # re-key the cache entry under the fresh mtime so readers keep hitting
+    _mapping_cache_put(path, mapping, json_file)
+
+
+# Component lookup index per cached mapping: maps (slide_index, component id)
+# to the component dict so drag-storm updates skip the linear scan. Keyed by
+# id() with the mapping pinned in the value to rule out id reuse.
+_COMPONENT_INDEX: "OrderedDict[int, tuple[dict, dict]]" = OrderedDict()
+def _is_num(v, _types=(int, float)):
+    return isinstance(v, _types)
+
+
+def _component_index(mapping: dict) -> dict:
+    key = id(mapping)
+    with _MAPPING_CACHE_LOCK:
+        hit = _COMPONENT_INDEX.get(key)
+        if hit is not None and hit[0] is mapping:
+            _COMPONENT_INDEX.move_to_end(key)
+            return hit[1]
+    index = {}
+    for i, slide in enumerate(mapping.get('slides', [])):
+        for comp in slide.get('components', []):
+            index[(i, comp.get('id'))] = comp
+    with _MAPPING_CACHE_LOCK:
+        _COMPONENT_INDEX[key] = (mapping, index)
+        _COMPONENT_INDEX.move_to_end(key)
+        while len(_COMPONENT_INDEX) > _MAPPING_CACHE_MAX:
+            _COMPONENT_INDEX.popitem(last=False)
+    return index
+
+
+def _invalidate_component_index(mapping: dict) -> None:
+    with _MAPPING_CACHE_LOCK:
+        _COMPONENT_INDEX.pop(id(mapping), None)
+
+
+# Per-edit writes go to an append-only journal instead of rewriting the
+# whole mapping JSON; the journal is folded onto the base on load and
+# compacted back into the canonical file lazily.
+_EDITS_FILE = "edits.jsonl"
+_EDITS_COMPACT_BYTES = 256 * 1024
+
+
+def _append_edit(job_dir: str, event: dict) -> None:
+    if orjson is not None:
+        line = orjson.dumps(event) + b"\n"
+    else:
+        line = json.dumps(event, separators=(",", ":")).encode("utf-8") + b"\n"
+    path = os.path.join(job_dir, _EDITS_FILE)
+    with open(path, "ab") as f:
+        f.write(line)
+        size = f.tell()
+    if size >= _EDITS_COMPACT_BYTES:
+        _compact_edits(job_dir, sync=False)
+
+
+def _apply_edit(mapping: dict, event: dict) -> None:
+    slides = mapping.get("slides", [])
+    idx = event.get("slide")
+    if not isinstance(idx, int) or idx < 0 or idx >= len(slides):
+        return
+    comps = slides[idx].get("components", [])
+    cid = event.get("cid")
+    if event.get("op") == "delete":
+        comps[:] = [c for c in comps if c.get("id") != cid]
+        return
+    for c in comps:
+        if c.get("id") == cid:
+            if "bbox_rel" in event:
+                c["bbox_rel"] = event["bbox_rel"]
+            break
+
+
+def _fold_edits(job_dir: str, mapping: dict) -> int:
+    """Replay journal events onto mapping in place; returns events applied."""
+    try:
+        with open(os.path.join(job_dir, _EDITS_FILE), "rb") as f:
+            raw = f.read()
+    except OSError:
+        return 0
+    loads = orjson.loads if orjson is not None else json.loads
+    n = 0
+    for line in raw.splitlines():
+        if not line:
+            continue
+        try:
+            _apply_edit(mapping, loads(line))
+            n += 1
+        except Exception:
+            continue
+    return n
+
+
+class _PendingSaves:
+    """Debounces full-mapping rewrites.
+
+    A drag storm can trip the journal size threshold repeatedly; deferring
+    the rewrite by a short window coalesces those into one disk write. The
+    registered atexit flush writes out anything still pending on shutdown.
+    """
+
+    def __init__(self, delay: float = 0.2):
+        self._delay = delay
+        self._lock = threading.Lock()
+        self._timers: dict = {}
+        self._pending: dict = {}
+
+    def schedule(self, job_dir, mapping, json_file, journal_path=None):
+        with self._lock:
+            self._pending[job_dir] = (mapping, json_file, journal_path)
+            timer = self._timers.get(job_dir)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self._delay, self._fire, args=(job_dir,))
+            timer.daemon = True
+            self._timers[job_dir] = timer
+            timer.start()
+
+    def _fire(self, job_dir):
+        with self._lock:
+            self._timers.pop(job_dir, None)
+            entry = self._pending.pop(job_dir, None)
+        if entry is None:
+            return
+        mapping, json_file, journal_path = entry
+        try:
+            # Snapshot the journal size before serializing: lines appended
+            # while the rewrite runs are not covered by it and must survive.
+            offset = _journal_size(journal_path) if journal_path else 0
+            _save_job_mapping(job_dir, mapping, json_file)
+            if journal_path is not None:
+                _release_journal(journal_path, offset)
+        except Exception:
+            pass
+
+    def flush(self):
+        with self._lock:
+            job_dirs = list(self._pending)
+        for job_dir in job_dirs:
+            self._fire(job_dir)
+
+
+_PENDING_SAVES = _PendingSaves()
+atexit.register(_PENDING_SAVES.flush)
+
+
+def _journal_size(path: str) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _release_journal(path: str, offset: int) -> None:
+    """Remove the journal once a rewrite covering its first offset bytes landed.
+
+    If the file grew past offset, an edit was acknowledged after the mapping
+    was serialized; removing the file would lose it, so leave the journal for
+    the next compaction instead (replaying already-folded lines is harmless —
+    events are idempotent absolute sets and deletes).
+    """
+    try:
+        if os.path.getsize(path) > offset:
+            return
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _compact_edits(job_dir: str, sync: bool = True) -> None:
+    """Fold the journal into the canonical JSON and truncate it.
+
+    Events are idempotent (absolute bbox sets and deletes), so a crash
+    between the rewrite and the unlink only replays them harmlessly. With
+    sync=False the rewrite is debounced through _PENDING_SAVES and the
+    journal is only removed once the write has landed.
+    """
+    path = os.path.join(job_dir, _EDITS_FILE)
+    if not os.path.isfile(path):
+        return
+    mapping, json_file = _load_job_mapping(job_dir)  # journal already folded
+
+    if sync:
+        offset = _journal_size(path)
+        _save_job_mapping(job_dir, mapping, json_file)
+        _release_journal(path, offset)
+    else:
+        _PENDING_SAVES.schedule(job_dir, mapping, json_file, journal_path=path)
 
 
 # ---------- web server (restored) ----------
 
-def create_app():
+def create_app(production: bool = False):
     if Flask is None:
         raise RuntimeError("Flask is not installed. Please install dependencies and try again.")
 
@@ -400,6 +1024,11 @@ def create_app():
 
     app = Flask(__name__)
     app.config["MAX_CONTENT_LENGTH"] = 128 * 1024 * 1024
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 86400
+    if production:
+        # Behind nginx/uwsgi the X-Sendfile header lets the front server stream
+        # PNGs/JSON with sendfile(2) instead of pushing bytes through Python.
+        app.config["USE_X_SENDFILE"] = True
 
     INDEX_HTML = """
     <!doctype html>
@@ -477,6 +1106,43 @@ def create_app():
     </html>
     """
 
+    PROCESSING_HTML = """
+    <!doctype html>
+    <html>
+    <head>
+      <meta charset=\"utf-8\"/>
+      <title>Processing - PPTX Spatial Map</title>
+      <style>
+        body { font-family: system-ui, -apple-system, Segoe UI, Roboto, sans-serif; margin: 24px; }
+        .card { border: 1px solid #e2e8f0; border-radius: 8px; padding: 16px; max-width: 560px; }
+        .muted { color: #64748b; }
+      </style>
+    </head>
+    <body>
+      <a href=\"{{ url_for('index') }}\">← Back</a>
+      <div class=\"card\">
+        <h2>Processing presentation…</h2>
+        <p class=\"muted\" id=\"msg\">This page will refresh automatically when the job is ready.</p>
+      </div>
+      <script>
+        async function poll() {
+          try {
+            const r = await fetch('{{ url_for('job_status', job_id=job_id) }}');
+            const s = await r.json();
+            if (s.status === 'done') { location.reload(); return; }
+            if (s.status === 'error') {
+              document.getElementById('msg').textContent = 'Processing failed: ' + (s.error || 'unknown error');
+              return;
+            }
+          } catch (e) {}
+          setTimeout(poll, 1500);
+        }
+        poll();
+      </script>
+    </body>
+    </html>
+    """
+
     EDITOR_HTML = """
     <!doctype html>
     <html>
@@ -685,24 +1351,62 @@ def create_app():
     </html>
     """
 
+    # Compile the inline templates once at startup; render_template_string
+    # would re-parse them on every request.
+    app.config["TEMPLATES_AUTO_RELOAD"] = False
+    app.jinja_env.auto_reload = False
+    INDEX_TMPL = app.jinja_env.from_string(INDEX_HTML)
+    JOB_TMPL = app.jinja_env.from_string(JOB_HTML)
+    PROCESSING_TMPL = app.jinja_env.from_string(PROCESSING_HTML)
+    EDITOR_TMPL = app.jinja_env.from_string(EDITOR_HTML)
+
+    # One zstd compression context per worker thread: contexts are reusable
+    # but not safe to share across threads.
+    _zstd_local = threading.local()
+
+    def _zstd_compress(raw: bytes) -> bytes:
+        cctx = getattr(_zstd_local, 'cctx', None)
+        if cctx is None:
+            cctx = _zstd_local.cctx = zstandard.ZstdCompressor(level=3)
+        return cctx.compress(raw)
+
+    _JOB_ID_RE = re.compile(r"[A-Za-z0-9-]+")
+
+    @app.before_request
+    def _resolve_job_dir():
+        # Validate job_id once per request and cache the resolved directory
+        # on g; the strict charset keeps the f-string join traversal-safe.
+        args = request.view_args
+        job_id = args.get('job_id') if args else None
+        if job_id is not None:
+            if not _JOB_ID_RE.fullmatch(job_id):
+                abort(404)
+            g.job_dir = f"{JOBS_DIR}{os.sep}{job_id}"
+
     def _list_jobs(limit=20):
         jobs = []
         if not os.path.isdir(JOBS_DIR):
             return jobs
-        for job_id in sorted(os.listdir(JOBS_DIR), reverse=True):
-            job_dir = os.path.join(JOBS_DIR, job_id)
-            if not os.path.isdir(job_dir):
-                continue
-            json_files = [f for f in os.listdir(job_dir) if f.endswith('.spatial.json')]
-            if not json_files:
-                continue
-            json_file = json_files[0]
+        try:
+            with os.scandir(JOBS_DIR) as it:
+                entries = sorted((e for e in it if e.is_dir(follow_symlinks=False)),
+                                 key=lambda e: e.stat().st_mtime, reverse=True)
+        except OSError:
+            return jobs
+        for entry in entries:
+            job_dir = entry.path
             try:
-                with open(os.path.join(job_dir, json_file), 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                pptx_name = os.path.basename(data.get('file', 'presentation.pptx'))
-                num_slides = len((data or {}).get('slides', []))
-                jobs.append({"job_id": job_id, "pptx_name": pptx_name, "num_slides": num_slides})
+                meta = _load_job_meta(job_dir)
+                if meta:
+                    # tiny sidecar written at job creation; avoids parsing the mapping
+                    pptx_name = meta.get('pptx_name', 'presentation.pptx')
+                    num_slides = int(meta.get('num_slides', 0))
+                else:
+                    # legacy job without a summary sidecar
+                    data, _ = _load_job_mapping(job_dir)
+                    pptx_name = os.path.basename(data.get('file', 'presentation.pptx'))
+                    num_slides = len((data or {}).get('slides', []))
+                jobs.append({"job_id": entry.name, "pptx_name": pptx_name, "num_slides": num_slides})
             except Exception:
                 continue
             if len(jobs) >= limit:
@@ -711,7 +1415,7 @@ def create_app():
 
     @app.get("/")
     def index():
-        return render_template_string(INDEX_HTML, jobs=_list_jobs())
+        return INDEX_TMPL.render(jobs=_list_jobs())
 
     @app.post("/upload")
     def upload():
@@ -724,27 +1428,41 @@ def create_app():
             abort(400, "Only .pptx files are supported")
         temp_path = os.path.join(UPLOAD_DIR, uuid.uuid4().hex + ".pptx")
         file.save(temp_path)
-        job = _process_upload_to_job(temp_path, file.filename)
-        return redirect(url_for("view_job", job_id=job["job_id"]))
+        job_id = _submit_job(temp_path, file.filename)
+        return redirect(url_for("view_job", job_id=job_id))
+
+    @app.get("/api/job/<job_id>/status")
+    def job_status(job_id):
+        job_dir = g.job_dir
+        if not os.path.isdir(job_dir):
+            abort(404)
+        return jsonify(_read_job_status(job_dir))
 
     @app.get("/job/<job_id>")
     def view_job(job_id):
-        job_dir = os.path.join(JOBS_DIR, job_id)
+        job_dir = g.job_dir
         if not os.path.isdir(job_dir):
             abort(404)
-        json_files = [f for f in os.listdir(job_dir) if f.endswith('.spatial.json')]
-        if not json_files:
-            abort(404)
-        json_file = json_files[0]
-        with open(os.path.join(job_dir, json_file), 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        pptx_name = os.path.basename(data.get('file', 'presentation.pptx'))
-        num_slides = len((data or {}).get('slides', []))
-        return render_template_string(JOB_HTML, job_id=job_id, pptx_name=pptx_name, num_slides=num_slides)
+        status = _read_job_status(job_dir)
+        if status.get("status") != "done":
+            code = 500 if status.get("status") == "error" else 202
+            return PROCESSING_TMPL.render(job_id=job_id), code
+        meta = _load_job_meta(job_dir)
+        if meta:
+            pptx_name = meta.get('pptx_name', 'presentation.pptx')
+            num_slides = int(meta.get('num_slides', 0))
+        else:
+            json_file = _job_json_file(job_dir)
+            if not json_file:
+                abort(404)
+            data = _read_json_file(os.path.join(job_dir, json_file))
+            pptx_name = os.path.basename(data.get('file', 'presentation.pptx'))
+            num_slides = len((data or {}).get('slides', []))
+        return JOB_TMPL.render(job_id=job_id, pptx_name=pptx_name, num_slides=num_slides)
 
     @app.get("/job/<job_id>/edit/<int:slide_index>")
     def edit_slide(job_id, slide_index):
-        job_dir = os.path.join(JOBS_DIR, job_id)
+        job_dir = g.job_dir
         if not os.path.isdir(job_dir):
             abort(404)
         mapping, _ = _load_job_mapping(job_dir)
@@ -753,7 +1471,7 @@ def create_app():
             abort(404)
         canvas = slides[slide_index].get('canvas', {})
         pptx_name = os.path.basename(mapping.get('file', 'presentation.pptx'))
-        return render_template_string(EDITOR_HTML,
+        return EDITOR_TMPL.render(
                                       job_id=job_id,
                                       slide_index=slide_index,
                                       num_slides=len(slides),
@@ -765,44 +1483,52 @@ def create_app():
 
     @app.get("/api/job/<job_id>/slide/<int:slide_index>")
     def get_slide(job_id, slide_index):
-        job_dir = os.path.join(JOBS_DIR, job_id)
+        job_dir = g.job_dir
         mapping, _ = _load_job_mapping(job_dir)
         slides = mapping.get('slides', [])
         if slide_index < 0 or slide_index >= len(slides):
             abort(404)
+        # Component-rich slides serialize to hundreds of KB of redundant
+        # JSON; zstd shrinks that 5-10x for clients that advertise it.
+        if zstandard is not None and 'zstd' in request.headers.get('Accept-Encoding', ''):
+            if orjson is not None:
+                raw = orjson.dumps(slides[slide_index])
+            else:
+                raw = json.dumps(slides[slide_index]).encode('utf-8')
+            resp = Response(_zstd_compress(raw), mimetype='application/json')
+            resp.headers['Content-Encoding'] = 'zstd'
+            resp.headers['Vary'] = 'Accept-Encoding'
+            return resp
         return jsonify(slides[slide_index])
 
     @app.post("/api/job/<job_id>/slide/<int:slide_index>/component/<cid>")
     def update_component(job_id, slide_index, cid):
-        job_dir = os.path.join(JOBS_DIR, job_id)
-        mapping, json_file = _load_job_mapping(job_dir)
+        job_dir = g.job_dir
+        mapping, _ = _load_job_mapping(job_dir)
         slides = mapping.get('slides', [])
         if slide_index < 0 or slide_index >= len(slides):
             abort(404)
         payload = request.get_json(force=True, silent=True) or {}
         bbox = payload.get('bbox_rel')
-        if not (isinstance(bbox, list) and len(bbox) == 4 and all(isinstance(v, (int, float)) for v in bbox)):
+        if not (isinstance(bbox, list) and len(bbox) == 4 and all(map(_is_num, bbox))):
             abort(400, 'bbox_rel must be [x,y,w,h]')
-        x,y,w,h = bbox
-        x = max(0.0, min(1.0, float(x)))
-        y = max(0.0, min(1.0, float(y)))
-        w = max(0.0, min(1.0 - x, float(w)))
-        h = max(0.0, min(1.0 - y, float(h)))
-        updated = None
-        for comp in slides[slide_index].get('components', []):
-            if comp.get('id') == cid:
-                comp['bbox_rel'] = [x,y,w,h]
-                updated = comp
-                break
+        arr = np.asarray(bbox, dtype=np.float64)
+        arr[:2] = np.clip(arr[:2], 0.0, 1.0)
+        arr[2] = np.clip(arr[2], 0.0, 1.0 - arr[0])
+        arr[3] = np.clip(arr[3], 0.0, 1.0 - arr[1])
+        x, y, w, h = arr.tolist()
+        updated = _component_index(mapping).get((slide_index, cid))
         if updated is None:
             abort(404)
-        _save_job_mapping(job_dir, mapping, json_file)
+        updated['bbox_rel'] = [x, y, w, h]
+        _append_edit(job_dir, {"ts": datetime.utcnow().isoformat(),
+                               "slide": slide_index, "cid": cid, "bbox_rel": [x, y, w, h]})
         return jsonify(updated)
 
     @app.delete("/api/job/<job_id>/slide/<int:slide_index>/component/<cid>")
     def delete_component(job_id, slide_index, cid):
-        job_dir = os.path.join(JOBS_DIR, job_id)
-        mapping, json_file = _load_job_mapping(job_dir)
+        job_dir = g.job_dir
+        mapping, _ = _load_job_mapping(job_dir)
         slides = mapping.get('slides', [])
         if slide_index < 0 or slide_index >= len(slides):
             abort(404)
@@ -811,57 +1537,97 @@ def create_app():
         comps[:] = [c for c in comps if c.get('id') != cid]
         if len(comps) == before:
             abort(404)
-        _save_job_mapping(job_dir, mapping, json_file)
+        _invalidate_component_index(mapping)
+        _append_edit(job_dir, {"ts": datetime.utcnow().isoformat(),
+                               "slide": slide_index, "cid": cid, "op": "delete"})
         return ('', 204)
 
+    def _send_cached_image(dir_path, filename):
+        # Slide images are immutable per job: an mtime/size ETag plus
+        # Last-Modified turns editor refreshes into 304s with no body read.
+        try:
+            st = os.stat(os.path.join(dir_path, filename))
+        except OSError:
+            abort(404)
+        return send_from_directory(dir_path, filename, mimetype='image/png',
+                                   conditional=True,
+                                   last_modified=st.st_mtime,
+                                   etag=f"{st.st_mtime_ns:x}-{st.st_size:x}",
+                                   max_age=86400)
+
     @app.get("/job/<job_id>/slide_image/<int:slide_index>")
     def slide_image(job_id, slide_index):
-        job_dir = os.path.join(JOBS_DIR, job_id)
+        job_dir = g.job_dir
         img_path = _find_real_slide_image(job_dir, slide_index)
         if not img_path:
             try:
-                pptx_files = [f for f in os.listdir(job_dir) if f.lower().endswith('.pptx')]
-                if pptx_files:
-                    _export_real_slide_images(os.path.join(job_dir, pptx_files[0]), job_dir)
+                meta = _load_job_meta(job_dir)
+                pptx_name = meta.get('pptx_name') if meta else None
+                if not (pptx_name and os.path.isfile(os.path.join(job_dir, pptx_name))):
+                    pptx_files = _scandir_files(job_dir, '.pptx', lower=True)
+                    pptx_name = pptx_files[0] if pptx_files else None
+                if pptx_name:
+                    expected = int(meta['num_slides']) if meta and meta.get('num_slides') else None
+                    _export_real_slide_images(os.path.join(job_dir, pptx_name), job_dir,
+                                              expected=expected)
                     img_path = _find_real_slide_image(job_dir, slide_index)
             except Exception:
                 img_path = None
         if img_path:
-            return send_from_directory(os.path.dirname(img_path), os.path.basename(img_path))
+            return _send_cached_image(os.path.dirname(img_path), os.path.basename(img_path))
         filename = f"slide_{slide_index:02d}.png"
-        previews_dirs = [d for d in os.listdir(job_dir) if d.endswith("_previews") and os.path.isdir(os.path.join(job_dir, d))]
-        if not previews_dirs:
+        previews_dir = _job_previews_dir(job_dir)
+        if not previews_dir:
             abort(404)
-        previews_dir = os.path.join(job_dir, previews_dirs[0])
-        return send_from_directory(previews_dir, filename)
+        return _send_cached_image(previews_dir, filename)
 
     @app.get("/job/<job_id>/json")
     def download_json(job_id):
-        job_dir = os.path.join(JOBS_DIR, job_id)
+        job_dir = g.job_dir
         if not os.path.isdir(job_dir):
             abort(404)
-        json_files = [f for f in os.listdir(job_dir) if f.endswith('.spatial.json')]
-        if not json_files:
+        # Fold any pending edit-journal entries into the canonical file so
+        # the download always reflects the latest edits.
+        try:
+            _compact_edits(job_dir)
+        except Exception:
+            pass
+        json_file = _job_json_file(job_dir)
+        if not json_file:
             abort(404)
-        json_file = json_files[0]
-        return send_from_directory(job_dir, json_file, as_attachment=True, download_name=json_file)
+        json_path = os.path.join(job_dir, json_file)
+        st = os.stat(json_path)
+        # Hand the open file to the WSGI server's file_wrapper so the bytes
+        # never pass through Python; chunked reads are the fallback.
+        f = open(json_path, 'rb')
+        wrapper = request.environ.get('wsgi.file_wrapper')
+        body = wrapper(f, 65536) if wrapper else iter(lambda: f.read(65536), b'')
+        resp = Response(body, mimetype='application/json', direct_passthrough=True)
+        resp.headers['Content-Length'] = str(st.st_size)
+        resp.headers['Content-Disposition'] = f'attachment; filename="{json_file}"'
+        resp.set_etag(f"{st.st_mtime_ns:x}-{st.st_size:x}")
+        resp.last_modified = st.st_mtime
+        return resp.make_conditional(request)
 
     @app.get("/job/<job_id>/previews/<path:filename>")
     def preview_image(job_id, filename):
-        job_dir = os.path.join(JOBS_DIR, job_id)
+        job_dir = g.job_dir
         if not os.path.isdir(job_dir):
             abort(404)
-        previews_dirs = [d for d in os.listdir(job_dir) if d.endswith("_previews") and os.path.isdir(os.path.join(job_dir, d))]
-        if not previews_dirs:
+        previews_dir = _job_previews_dir(job_dir)
+        if not previews_dir:
             abort(404)
-        previews_dir = os.path.join(job_dir, previews_dirs[0])
-        return send_from_directory(previews_dir, filename)
+        return _send_cached_image(previews_dir, filename)
 
     return app
 
 
-def serve(host: str = "127.0.0.1", port: int = 5000) -> None:
-    app = create_app()
+def serve(host: str = "127.0.0.1", port: int = 5000, production: bool = False) -> None:
+    app = create_app(production=production)
+    if not production:
+        print("Serving previews/JSON through the Flask dev server; "
+              "use --production behind nginx/uwsgi to offload file sends via X-Sendfile.",
+              file=sys.stderr)
     app.run(host=host, port=port, debug=False)
 
 
@@ -884,8 +1650,77 @@ def _new_job_id():
     return datetime.utcnow().strftime("%Y%m%d-%H%M%S-") + uuid.uuid4().hex[:8]
 
 
-def _process_upload_to_job(src_path, original_name):
-    """Create a job folder, process PPTX, render previews, write JSON; return job info."""
+# Background job processing: uploads are queued to a process pool so the
+# WSGI worker is freed immediately and the browser polls for completion.
+_JOB_EXECUTOR = None
+_JOB_EXECUTOR_LOCK = threading.Lock()
+_JOB_FUTURES: dict = {}
+
+
+def _get_job_executor():
+    global _JOB_EXECUTOR
+    with _JOB_EXECUTOR_LOCK:
+        if _JOB_EXECUTOR is None:
+            from concurrent.futures import ProcessPoolExecutor
+            _JOB_EXECUTOR = ProcessPoolExecutor(max_workers=max(1, os.cpu_count() or 1))
+        return _JOB_EXECUTOR
+
+
+def _write_job_status(job_dir, status, **extra):
+    payload = {"status": status}
+    payload.update(extra)
+    _write_json_file(os.path.join(job_dir, "status.json"), payload)
+
+
+def _read_job_status(job_dir):
+    path = os.path.join(job_dir, "status.json")
+    if not os.path.isfile(path):
+        # Jobs created before status tracking are always complete.
+        return {"status": "done"}
+    try:
+        return _read_json_file(path)
+    except Exception:
+        return {"status": "error", "error": "status unreadable"}
+
+
+def _run_job(job_dir, stored_pptx, base_name):
+    """Process an uploaded PPTX inside a job folder: parse, write JSON, render previews."""
+    try:
+        _write_job_status(job_dir, "processing")
+        mapping = process_pptx(stored_pptx)
+
+        # Write JSON
+        json_path = os.path.join(job_dir, os.path.splitext(base_name)[0] + ".spatial.json")
+        _write_json_file(json_path, mapping)
+
+        # Render previews inside job dir
+        previews_dir = os.path.join(job_dir, os.path.splitext(base_name)[0] + "_previews")
+
+        # Tiny summary sidecar: listings and per-job file lookups read this
+        # instead of re-scanning the job dir or parsing the mapping.
+        _write_json_file(os.path.join(job_dir, "summary.json"), {
+            "pptx_name": base_name,
+            "num_slides": len(mapping.get("slides", [])),
+            "json_file": os.path.basename(json_path),
+            "previews_rel": os.path.basename(previews_dir),
+            "slides_png_rel": "slides_png",
+        })
+        draw_previews(mapping, previews_dir, img_width=1200, stroke=2, draw_labels=True, show_legend=True, show_groups=True)
+
+        # Try to export real slide images via LibreOffice, if available
+        try:
+            _export_real_slide_images(stored_pptx, job_dir,
+                                      expected=len(mapping.get("slides", [])))
+        except Exception:
+            pass
+
+        _write_job_status(job_dir, "done", num_slides=len(mapping.get("slides", [])))
+    except Exception as e:
+        _write_job_status(job_dir, "error", error=str(e))
+
+
+def _submit_job(src_path, original_name):
+    """Create a job folder, store the upload, and queue processing; return the job id."""
     job_id = _new_job_id()
     job_dir = os.path.join(JOBS_DIR, job_id)
     os.makedirs(job_dir, exist_ok=True)
@@ -901,34 +1736,106 @@ def _process_upload_to_job(src_path, original_name):
         import shutil
         shutil.copy2(src_path, stored_pptx)
 
-    mapping = process_pptx(stored_pptx)
+    _write_job_status(job_dir, "pending")
+    fut = _get_job_executor().submit(_run_job, job_dir, stored_pptx, base_name)
+    _JOB_FUTURES[job_id] = fut
+    fut.add_done_callback(lambda _f: _JOB_FUTURES.pop(job_id, None))
+    return job_id
 
-    # Write JSON
-    json_path = os.path.join(job_dir, os.path.splitext(base_name)[0] + ".spatial.json")
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(mapping, f, indent=2)
 
-    # Render previews inside job dir
-    previews_dir = os.path.join(job_dir, os.path.splitext(base_name)[0] + "_previews")
-    draw_previews(mapping, previews_dir, img_width=1200, stroke=2, draw_labels=True, show_legend=True, show_groups=True)
+def _uno_prop(name, value):
+    p = _UnoPropertyValue()
+    p.Name = name
+    p.Value = value
+    return p
 
-    # Try to export real slide images via LibreOffice, if available
-    try:
-        _export_real_slide_images(stored_pptx, job_dir)
-    except Exception:
-        pass
 
-    return {
-        "job_id": job_id,
-        "job_dir": job_dir,
-        "pptx_name": base_name,
-        "json_file": os.path.basename(json_path),
-        "previews_rel": os.path.basename(previews_dir),
-        "num_slides": len(mapping.get("slides", [])),
-    }
+class _LibreOfficeService:
+    """Long-lived headless LibreOffice driven over the UNO socket bridge.
+
+    Spawning soffice per upload costs seconds of cold start; one persistent
+    listener amortizes that across all jobs. Only usable when the python-uno
+    bridge is importable — callers fall back to one-shot subprocess
+    conversion otherwise.
+    """
 
+    _PORT = 2002
+
+    def __init__(self):
+        self._lock = threading.Lock()  # the UNO bridge is not reentrant
+        self._proc = None
+        self._ctx = None
+
+    def _connect(self):
+        import shutil, subprocess, time
+        if self._ctx is not None and (self._proc is None or self._proc.poll() is None):
+            return self._ctx
+        self._ctx = None
+        soffice = shutil.which("soffice") or shutil.which("libreoffice")
+        if not soffice:
+            return None
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                [soffice, "--headless", "--nologo", "--nofirststartwizard", "--norestore",
+                 f"--accept=socket,host=127.0.0.1,port={self._PORT};urp;StarOffice.ServiceManager"],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        local_ctx = uno.getComponentContext()
+        resolver = local_ctx.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_ctx)
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                self._ctx = resolver.resolve(
+                    f"uno:socket,host=127.0.0.1,port={self._PORT};urp;StarOffice.ComponentContext")
+                return self._ctx
+            except Exception:
+                if time.monotonic() >= deadline:
+                    return None
+                time.sleep(0.25)
+
+    def convert_to_pdf(self, pptx_path, out_dir):
+        """Export pptx_path to a PDF under out_dir; return its path or None."""
+        if uno is None:
+            return None
+        with self._lock:
+            ctx = self._connect()
+            if ctx is None:
+                return None
+            try:
+                desktop = ctx.ServiceManager.createInstanceWithContext(
+                    "com.sun.star.frame.Desktop", ctx)
+                doc = desktop.loadComponentFromURL(
+                    uno.systemPathToFileUrl(os.path.abspath(pptx_path)),
+                    "_blank", 0, (_uno_prop("Hidden", True),))
+                if doc is None:
+                    return None
+                pdf_path = os.path.join(out_dir, "slides.pdf")
+                try:
+                    doc.storeToURL(uno.systemPathToFileUrl(pdf_path),
+                                   (_uno_prop("FilterName", "impress_pdf_Export"),))
+                finally:
+                    doc.close(False)
+                return pdf_path if os.path.isfile(pdf_path) else None
+            except Exception:
+                return None
 
-def _export_real_slide_images(pptx_path, job_dir):
+    def shutdown(self):
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.terminate()
+        self._proc = None
+        self._ctx = None
+
+
+_LO_SERVICE = _LibreOfficeService()
+if uno is not None:
+    atexit.register(_LO_SERVICE.shutdown)
+
+# Caps total pdftoppm processes across concurrent uploads so parallel
+# per-page rendering cannot oversubscribe the machine.
+_PDF_RENDER_SEM = threading.BoundedSemaphore(max(1, os.cpu_count() or 1))
+
+
+def _export_real_slide_images(pptx_path, job_dir, expected: int | None = None):
     """Export real slide images.
     Strategy:
       1) Try LibreOffice to PNG for all slides
@@ -940,15 +1847,17 @@ def _export_real_slide_images(pptx_path, job_dir):
     out_dir = os.path.join(job_dir, "slides_png")
     os.makedirs(out_dir, exist_ok=True)
 
-    # Determine expected slide count from PPTX
-    try:
-        expected = len(Presentation(pptx_path).slides)
-    except Exception:
-        expected = None
+    # Determine expected slide count from PPTX unless the caller already
+    # knows it from the parsed mapping — reopening is a full unzip+parse.
+    if expected is None:
+        try:
+            expected = len(Presentation(pptx_path).slides)
+        except Exception:
+            expected = None
 
     def list_pngs():
         try:
-            return sorted([f for f in os.listdir(out_dir) if f.lower().endswith('.png')])
+            return sorted(_scandir_files(out_dir, '.png', lower=True))
         except Exception:
             return []
 
@@ -956,7 +1865,9 @@ def _export_real_slide_images(pptx_path, job_dir):
     existing = list_pngs()
 
     soffice = shutil.which("soffice") or shutil.which("libreoffice")
-    if not existing and soffice:
+    # With the persistent UNO service available, skip the one-shot PNG convert
+    # (it only yields the first slide anyway) and go straight to the PDF path.
+    if not existing and soffice and uno is None:
         try:
             subprocess.run([soffice, "--headless", "--convert-to", "png", "--outdir", out_dir, pptx_path],
                            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=180)
@@ -970,20 +1881,39 @@ def _export_real_slide_images(pptx_path, job_dir):
         if soffice and pdftoppm:
             try:
                 with tempfile.TemporaryDirectory() as td:
-                    pdf_path = os.path.join(td, "slides.pdf")
-                    # Export PPTX to PDF
-                    subprocess.run([soffice, "--headless", "--convert-to", "pdf", "--outdir", td, pptx_path],
-                                   check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=180)
-                    # Sometimes LibreOffice preserves filename; find the pdf
-                    if not os.path.isfile(pdf_path):
-                        pdfs = [f for f in os.listdir(td) if f.lower().endswith('.pdf')]
-                        if not pdfs:
-                            raise RuntimeError("PDF not produced")
-                        pdf_path = os.path.join(td, pdfs[0])
-                    # Render PDF pages to PNGs at reasonable DPI
+                    # Prefer the persistent UNO service; fall back to a
+                    # one-shot soffice invocation when it is unavailable.
+                    pdf_path = _LO_SERVICE.convert_to_pdf(pptx_path, td)
+                    if pdf_path is None:
+                        pdf_path = os.path.join(td, "slides.pdf")
+                        subprocess.run([soffice, "--headless", "--convert-to", "pdf", "--outdir", td, pptx_path],
+                                       check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=180)
+                        # Sometimes LibreOffice preserves filename; find the pdf
+                        if not os.path.isfile(pdf_path):
+                            pdfs = _scandir_files(td, '.pdf', lower=True)
+                            if not pdfs:
+                                raise RuntimeError("PDF not produced")
+                            pdf_path = os.path.join(td, pdfs[0])
+                    # Render PDF pages to PNGs at reasonable DPI. Rasterization
+                    # is independent per page, so when the page count is known
+                    # each page gets its own pdftoppm -f/-l shard.
                     prefix = os.path.join(out_dir, "slide")
-                    subprocess.run([pdftoppm, "-png", "-r", "144", pdf_path, prefix],
-                                   check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=180)
+                    if expected and expected > 1:
+                        from concurrent.futures import ThreadPoolExecutor
+
+                        def render_page(k):
+                            with _PDF_RENDER_SEM:
+                                subprocess.run([pdftoppm, "-png", "-r", "144",
+                                                "-f", str(k), "-l", str(k),
+                                                pdf_path, f"{prefix}-{k:02d}"],
+                                               check=True, stdout=subprocess.PIPE,
+                                               stderr=subprocess.PIPE, timeout=180)
+
+                        with ThreadPoolExecutor(max_workers=min(expected, os.cpu_count() or 1)) as ex:
+                            list(ex.map(render_page, range(1, expected + 1)))
+                    else:
+                        subprocess.run([pdftoppm, "-png", "-r", "144", pdf_path, prefix],
+                                       check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=180)
             except Exception:
                 pass
         existing = list_pngs()
@@ -992,31 +1922,34 @@ def _export_real_slide_images(pptx_path, job_dir):
     _normalize_slide_pngs(out_dir, expected)
 
 
+_SLIDE_NUM_RE = re.compile(r"(\d+)")
+_SLIDE_NORM_RE = re.compile(r"slide-\d{2}\.png")
+
+
 def _normalize_slide_pngs(out_dir: str, expected: int | None) -> None:
     try:
-        files = sorted([f for f in os.listdir(out_dir) if f.lower().endswith('.png')])
+        files = sorted(_scandir_files(out_dir, '.png', lower=True))
     except Exception:
         return
     if not files:
         return
-    import re, os
     # Map files to numeric slide index if found in filename
     file_to_num: dict[str, int] = {}
     for f in files:
-        nums = re.findall(r"(\d+)", f)
+        nums = _SLIDE_NUM_RE.findall(f)
         if nums:
             try:
                 n = int(nums[-1])  # use last number
                 file_to_num[f] = n  # assume 1-based
             except Exception:
                 pass
-    used = set()
+    taken: set[int] = set()
     # First, move files with explicit numbers to normalized names
     for f, n in file_to_num.items():
         target = os.path.join(out_dir, f"slide-{n:02d}.png")
         src = os.path.join(out_dir, f)
         if os.path.abspath(src) == os.path.abspath(target):
-            used.add(f)
+            taken.add(n)
             continue
         # Avoid overwriting: remove existing target
         if os.path.exists(target):
@@ -1026,25 +1959,19 @@ def _normalize_slide_pngs(out_dir: str, expected: int | None) -> None:
                 pass
         try:
             os.replace(src, target)
-            used.add(f)
+            taken.add(n)
         except Exception:
             pass
     # Refresh list after moves
     try:
-        remaining = sorted([f for f in os.listdir(out_dir) if f.lower().endswith('.png') and not re.fullmatch(r"slide-\d{2}\.png", f)])
+        remaining = sorted(f for f in _scandir_files(out_dir, '.png', lower=True) if not _SLIDE_NORM_RE.fullmatch(f))
     except Exception:
         remaining = []
-    # Assign remaining files by sorted order
-    # Determine max count to normalize to
-    count = expected if (isinstance(expected, int) and expected > 0) else len(remaining)
-    i = 1
+    # Assign remaining files to free slots in one pass; the taken set
+    # replaces the old per-file os.path.exists probe loop.
+    free_slots = (k for k in range(1, len(remaining) + len(taken) + 1) if k not in taken)
     for f in remaining:
-        # Find next unused normalized name
-        while True:
-            target = os.path.join(out_dir, f"slide-{i:02d}.png")
-            i += 1
-            if not os.path.exists(target):
-                break
+        target = os.path.join(out_dir, f"slide-{next(free_slots):02d}.png")
         src = os.path.join(out_dir, f)
         try:
             os.replace(src, target)
@@ -1052,21 +1979,70 @@ def _normalize_slide_pngs(out_dir: str, expected: int | None) -> None:
             pass
 
 
+def _paths_exist(paths):
+    """Existence flags for each path, batched through io_uring when available.
+
+    With liburing the statx calls for all paths go down in a single
+    submit+wait instead of one syscall each; elsewhere (or on any ring
+    error) this degrades to plain os.path.isfile.
+    """
+    if liburing is not None and paths:
+        try:
+            ring = liburing.io_uring()
+            liburing.io_uring_queue_init(max(2, len(paths)), ring, 0)
+            try:
+                bufs = []
+                for p in paths:
+                    sqe = liburing.io_uring_get_sqe(ring)
+                    buf = liburing.statx()
+                    liburing.io_uring_prep_statx(sqe, liburing.AT_FDCWD, p.encode(), 0, 0, buf)
+                    sqe.user_data = len(bufs)
+                    bufs.append(buf)
+                liburing.io_uring_submit(ring)
+                flags = [False] * len(paths)
+                cqe = liburing.io_uring_cqe()
+                for _ in paths:
+                    liburing.io_uring_wait_cqe(ring, cqe)
+                    flags[cqe.user_data] = cqe.res == 0
+                    liburing.io_uring_cqe_seen(ring, cqe)
+                return flags
+            finally:
+                liburing.io_uring_queue_exit(ring)
+        except Exception:
+            pass
+    return [os.path.isfile(p) for p in paths]
+
+
 def _find_real_slide_image(job_dir, slide_index):
     dirp = os.path.join(job_dir, 'slides_png')
-    if not os.path.isdir(dirp):
-        return None
-    # Support both unpadded and zero-padded filenames
+    # Support both unpadded and zero-padded filenames; one batched probe
+    # covers both candidates.
     unp = os.path.join(dirp, f"slide-{slide_index+1}.png")
-    if os.path.isfile(unp):
-        return unp
     pad = os.path.join(dirp, f"slide-{slide_index+1:02d}.png")
-    if os.path.isfile(pad):
+    exists = _paths_exist([unp, pad])
+    if exists[0]:
+        return unp
+    if exists[1]:
         return pad
     return None
 
 
 def _crop_save_png(src_img_path, rel_bbox, out_path, pad_px=2):
+    if pyvips is not None:
+        # libvips streams the source demand-driven, so only the cropped
+        # region is ever decoded; PIL below decodes the full image.
+        img = pyvips.Image.new_from_file(src_img_path, access='sequential')
+        W, H = img.width, img.height
+        x, y, w, h = rel_bbox
+        x0 = max(0, int(round(x * W)) - pad_px)
+        y0 = max(0, int(round(y * H)) - pad_px)
+        x1 = min(W, int(round((x + w) * W)) + pad_px)
+        y1 = min(H, int(round((y + h) * H)) + pad_px)
+        if x1 <= x0 or y1 <= y0:
+            return False
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        img.crop(x0, y0, x1 - x0, y1 - y0).pngsave(out_path, compression=6)
+        return True
     from PIL import Image
     with Image.open(src_img_path) as im:
         W, H = im.size
@@ -1091,6 +2067,8 @@ def main():
     p_serve = subparsers.add_parser("serve", help="Run local web server")
     p_serve.add_argument("--host", default="127.0.0.1", help="Host to bind (default: 127.0.0.1)")
     p_serve.add_argument("--port", type=int, default=5000, help="Port to bind (default: 5000)")
+    p_serve.add_argument("--production", action="store_true",
+                         help="Emit X-Sendfile headers for file responses (requires nginx/uwsgi front-end)")
 
     # CLI default: process a single file
     p_cli = subparsers.add_parser("process", help="Process a PPTX via CLI")
@@ -1102,7 +2080,7 @@ def main():
     args = parser.parse_args()
 
     if args.command == "serve":
-        serve(host=args.host, port=args.port)
+        serve(host=args.host, port=args.port, production=args.production)
         return
 
     in_path = None
@@ -1121,8 +2099,7 @@ def main():
     mapping = process_pptx(in_path)
 
     json_path = os.path.splitext(in_path)[0] + ".spatial.json"
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(mapping, f, indent=2)
+    _write_json_file(json_path, mapping)
     print(f"Wrote JSON: {json_path}")
 
     preview_dir = os.path.splitext(in_path)[0] + "_previews"